@@ -107,19 +107,22 @@ class DomainHandler:
         self.soa: str = str(config["soa"])
         self.nameservers: list[str] = list(str(ns) for ns in config["nameservers"])
         self.ttl: int = int(config["ttl"])
+        # Zone records do not depend on the query name, so we build the
+        # record fields once per qtype instead of branching on every query:
+        soa = [(self.domain, "SOA", self.ttl, self.soa)]
+        ns = [(self.domain, "NS", self.ttl, ns) for ns in self.nameservers]
+        self.qtype2records: dict[str, list[tuple[str, str, int, str]]] = {
+            "SOA": soa,
+            "NS": ns,
+            "ANY": soa + ns,
+        }
 
     def handle(self, query: Query) -> list[Response]:
+        # Callers must check that query.qname is within self.domain
         logging.debug("DomainHandler handling: %s", query)
-        if not query.qname.endswith(self.domain):
-            return []
         r: list[Response] = []
-        if query.qtype in ("SOA", "ANY"):
-            response = Response(query, self.domain, "SOA", self.ttl, self.soa)
-            r.append(response)
-        if query.qtype in ("NS", "ANY"):
-            for ns in self.nameservers:
-                response = Response(query, self.domain, "NS", self.ttl, ns)
-                r.append(response)
+        for qname, rtype, ttl, answer in self.qtype2records.get(query.qtype, ()):
+            r.append(Response(query, qname, rtype, ttl, answer))
         return r
 
 
@@ -220,10 +223,13 @@ class HandlerSet:
         self.qname2handlers: dict[str, list[NameHandler]] = dict(qname2handlers)
 
     def handle(self, query: Query) -> list[Response]:
+        # Plain suffix match, PowerDNS's pipe-regex already filters names
         if not query.qname.endswith(self.domain):
             return []
         r: list[Response] = self.domain_handler.handle(query)
-        for handler in self.qname2handlers.get(query.qname, []):
+        # Names without handlers, including random labels sent by scanners,
+        # only get the precomputed zone records:
+        for handler in self.qname2handlers.get(query.qname, ()):
             r.extend(handler.handle(query))
         return r
 
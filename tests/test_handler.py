@@ -82,6 +82,35 @@ class TestNameHandler(TestCase):
             pdyndns.process_query(instr, self.hs, fdout)
             self.assertNotRegex(fdout.getvalue(), outstr)
 
+    def test_handler_zone_records(self):
+        names = (
+            self.domain,
+            self.domain.upper(),
+            "unknown.dyndns.example.net",
+            "UnknowN.DyndnS.ExamplE.NeT",
+        )
+        soa = tabulate(
+            ("DATA", "0", "1", self.domain, "IN", "SOA", self.ttl, "-1", self.soa)
+        )
+        ns = ""
+        for n in self.config["nameservers"]:
+            ns += tabulate(
+                ("DATA", "0", "1", self.domain, "IN", "NS", self.ttl, "-1", n)
+            )
+        qtype2outstr = {"SOA": soa, "NS": ns, "ANY": soa + ns, "A": "", "AAAA": ""}
+        for name in names:
+            for qtype, outstr in qtype2outstr.items():
+                instr = tabulate(("Q", name, "IN", qtype, "-1", Q_RMT_LOCAL_EDNS))
+                fdout = StringIO()
+                pdyndns.process_query(instr, self.hs, fdout)
+                self.assertEqual(fdout.getvalue(), outstr)
+        instr = tabulate(
+            ("Q", "unknown.example.net", "IN", "ANY", "-1", Q_RMT_LOCAL_EDNS)
+        )
+        fdout = StringIO()
+        pdyndns.process_query(instr, self.hs, fdout)
+        self.assertEqual(fdout.getvalue(), "")
+
     def test_name_handler_file_rewind(self):
         for h in self.config["handlers"]:
             name = h["qname"]